@@ -3,6 +3,27 @@ from django.contrib import admin
 from .models import Category, Comment, Location, Post
 
 admin.site.register(Category)
-admin.site.register(Comment)
 admin.site.register(Location)
-admin.site.register(Post)
+
+
+@admin.register(Post)
+class PostAdmin(admin.ModelAdmin):
+    list_display = ('title', 'author', 'pub_date', 'is_published')
+    list_select_related = ('author', 'category', 'location')
+    list_filter = ('is_published', 'category')
+    search_fields = ('title',)
+    list_per_page = 50
+    show_full_result_count = False
+
+
+@admin.register(Comment)
+class CommentAdmin(admin.ModelAdmin):
+    list_display = ('text', 'author', 'post', 'created_at')
+    list_select_related = ('author', 'post')
+    list_per_page = 50
+    show_full_result_count = False
+
+    def get_readonly_fields(self, request, obj=None):
+        if obj is not None:
+            return ('post',)
+        return ()
@@ -1,6 +1,6 @@
 from django import forms
 
-from .models import Comment, Post
+from .models import Comment, Post, User
 
 
 class CommentForm(forms.ModelForm):
@@ -19,3 +19,17 @@ class PostForm(forms.ModelForm):
     class Meta:
         model = Post
         exclude = ['author', ]
+
+
+class PostEditForm(forms.ModelForm):
+
+    class Meta:
+        model = Post
+        fields = ('title', 'text', 'category', 'location', 'image', 'pub_date')
+
+
+class ProfileEditForm(forms.ModelForm):
+
+    class Meta:
+        model = User
+        fields = ('username', 'first_name', 'last_name', 'email')
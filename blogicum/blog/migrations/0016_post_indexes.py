@@ -0,0 +1,25 @@
+# Generated by Django 3.2.16 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_alter_post_pub_date'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_published', 'pub_date'], name='post_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', 'is_published', '-pub_date'], name='post_cat_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-pub_date'], name='post_author_pub_idx'),
+        ),
+    ]
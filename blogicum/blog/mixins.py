@@ -3,6 +3,10 @@ from django.contrib.auth.mixins import UserPassesTestMixin
 
 class OnlyAuthorMixin(UserPassesTestMixin):
 
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object(queryset)
+        return self._cached_object
+
     def test_func(self):
-        object = self.get_object()
-        return object.author == self.request.user
+        return self.get_object().author_id == self.request.user.id
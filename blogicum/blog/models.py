@@ -83,11 +83,49 @@ class Post(PublishedModel):
         'Изображение',
         upload_to='posts_images',
         blank=True)
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ['-pub_date', ]
+        indexes = [
+            models.Index(
+                fields=['is_published', 'pub_date'],
+                name='post_pub_idx'
+            ),
+            models.Index(
+                fields=['category', 'is_published', '-pub_date'],
+                name='post_cat_pub_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date'],
+                name='post_author_pub_idx'
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # comment_count is maintained by F() updates from the comment
+        # signals, so a full save must not write back a stale value.
+        if (
+            self.pk is not None
+            and not self._state.adding
+            and not args
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name != 'comment_count'
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
 
 
 class Comment(models.Model):
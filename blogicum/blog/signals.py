@@ -0,0 +1,40 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Comment, Post
+from .utils import (COUNT_CACHE_PREFIX, INDEX_CACHE_PREFIX,
+                    invalidate_cached_pages)
+
+
+def _invalidate_index():
+    invalidate_cached_pages(INDEX_CACHE_PREFIX)
+
+
+def _invalidate_index_and_counts():
+    invalidate_cached_pages(INDEX_CACHE_PREFIX)
+    invalidate_cached_pages(COUNT_CACHE_PREFIX)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_caches(sender, **kwargs):
+    transaction.on_commit(_invalidate_index_and_counts)
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+        transaction.on_commit(_invalidate_index)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
+    transaction.on_commit(_invalidate_index)
@@ -0,0 +1,28 @@
+import logging
+
+from celery import shared_task
+from kombu.exceptions import OperationalError
+
+from .models import Post, User
+from .utils import send_email_to_admin_bulk
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def send_email_to_admin(post_id, user_id):
+    try:
+        post = Post.objects.get(pk=post_id)
+        user = User.objects.get(pk=user_id)
+    except (Post.DoesNotExist, User.DoesNotExist):
+        return
+    send_email_to_admin_bulk([post], [user])
+
+
+def queue_email_to_admin(post_id, user_id):
+    try:
+        send_email_to_admin.apply_async((post_id, user_id), retry=False)
+    except OperationalError:
+        logger.warning(
+            'Не удалось поставить в очередь письмо о посте %s', post_id
+        )
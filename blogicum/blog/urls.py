@@ -1,7 +1,7 @@
 from django.contrib.auth import views as auth_views
 from django.urls import path
 
-from . import utils, views
+from . import views
 
 app_name = 'blog'
 
@@ -45,5 +45,4 @@ urlpatterns = [
     path('reset/done/',
          auth_views.PasswordResetCompleteView.as_view(),
          name='password_reset_complete'),
-    path('send_email/', utils.send_email_to_admin, name='send_email_to_admin'),
 ]
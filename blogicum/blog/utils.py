@@ -1,26 +1,135 @@
-from django.core.mail import send_mail
-from django.core.paginator import Paginator
-from django.http import HttpResponse
+import hashlib
+import time
+from datetime import datetime
+
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models.sql.where import WhereNode
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from .models import Post
 
 QUANTITY_POST = 10
+PAGE_CACHE_TIMEOUT = 60
+INDEX_CACHE_PREFIX = 'index'
+COUNT_CACHE_TIMEOUT = 300
+COUNT_CACHE_PREFIX = 'post_count'
+POST_CARD_FIELDS = (
+    'title',
+    'text',
+    'image',
+    'pub_date',
+    'is_published',
+    'comment_count',
+    'author__username',
+    'category__title',
+    'category__slug',
+    'category__is_published',
+    'location__name',
+    'location__is_published',
+)
 
 
-def send_email_to_admin(post, user):
-    subject = f'Новый пост: {post.title}'
-    message = f'''Пользователь {user.username}
-        создал пост '{post.title}'.'''
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email='user_email@blogicum.not',
-        recipient_list=['admin_email@blogicum.not'],
-        fail_silently=True
-    )
-    return HttpResponse('Email sent successfully!')
+def _round_datetimes(where):
+    for index, child in enumerate(where.children):
+        if isinstance(child, WhereNode):
+            _round_datetimes(child)
+        elif isinstance(getattr(child, 'rhs', None), datetime):
+            where.children[index] = type(child)(
+                child.lhs, child.rhs.replace(second=0, microsecond=0)
+            )
+
+
+class CachedCountPaginator(Paginator):
+
+    @cached_property
+    def _count_key(self):
+        # Listings filter on timezone.now(); round it to the minute before
+        # compiling, otherwise every request would hash to a new key.
+        query = self.object_list.query.clone()
+        _round_datetimes(query.where)
+        sql, params = query.sql_with_params()
+        digest = hashlib.md5(f'{sql}{params}'.encode()).hexdigest()
+        version = cache.get_or_set(f'{COUNT_CACHE_PREFIX}:version', 1, None)
+        return f'{COUNT_CACHE_PREFIX}:{version}:{digest}'
+
+    @cached_property
+    def count(self):
+        count = cache.get(self._count_key)
+        if count is None:
+            count = super().count
+            cache.set(self._count_key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
 
+def send_email_to_admin_bulk(posts, users):
+    messages = [
+        EmailMessage(
+            subject=f'Новый пост: {post.title}',
+            body=f'''Пользователь {user.username}
+        создал пост '{post.title}'.''',
+            from_email='user_email@blogicum.not',
+            to=['admin_email@blogicum.not'],
+        )
+        for post, user in zip(posts, users)
+    ]
+    connection = get_connection(fail_silently=True)
+    return connection.send_messages(messages)
 
-def paginated_pages(post_list, request):
-    paginator = Paginator(post_list, QUANTITY_POST)
+
+def paginated_pages(post_list, request, cache_key_prefix=None,
+                    per_page=QUANTITY_POST):
+    paginator = CachedCountPaginator(post_list, per_page)
     page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    return page_obj
+    if cache_key_prefix is None:
+        return paginator.get_page(page_number)
+    try:
+        number = paginator.validate_number(page_number)
+    except PageNotAnInteger:
+        number = 1
+    except EmptyPage:
+        number = paginator.num_pages
+    version = cache.get_or_set(f'{cache_key_prefix}:version', 1, None)
+    key = (
+        f'{cache_key_prefix}:{version}:{per_page}:{number}:'
+        f'{int(time.time() // 60)}'
+    )
+    cached = cache.get(key)
+    if cached is None:
+        page_obj = paginator.page(number)
+        page_obj.object_list = list(page_obj.object_list)
+        cache.set(
+            key,
+            (page_obj.object_list, page_obj.number, paginator.count),
+            PAGE_CACHE_TIMEOUT
+        )
+        return page_obj
+    posts, number, paginator.count = cached
+    return Page(posts, number, paginator)
+
+
+def invalidate_cached_pages(cache_key_prefix):
+    try:
+        cache.incr(f'{cache_key_prefix}:version')
+    except ValueError:
+        pass
+
+
+def published_posts_qs(now=None):
+    if now is None:
+        now = timezone.now()
+    return Post.objects.select_related(
+        'category',
+        'location',
+        'author',
+    ).filter(
+        is_published=True,
+        category__is_published=True,
+        pub_date__lte=now
+    ).only(
+        *POST_CARD_FIELDS
+    ).order_by(
+        '-pub_date'
+    )
@@ -1,9 +1,9 @@
-import logging
+from functools import lru_cache
 
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.forms import PasswordResetForm, UserChangeForm
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -11,15 +11,22 @@ from django.utils import timezone
 from django.views.generic import (CreateView, DeleteView, DetailView, ListView,
                                   UpdateView)
 
-from .forms import CommentForm, PostForm
+from .forms import CommentForm, PostEditForm, PostForm, ProfileEditForm
 from .mixins import OnlyAuthorMixin
 from .models import Category, Comment, Post, User
-from .utils import paginated_pages, send_email_to_admin
+from .tasks import queue_email_to_admin
+from .utils import (INDEX_CACHE_PREFIX, POST_CARD_FIELDS, QUANTITY_POST,
+                    paginated_pages, published_posts_qs)
 
-logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1024)
+def _post_detail_url(pk):
+    return reverse('blog:post_detail', kwargs={'pk': pk})
 
 
 def password_reset(request):
+    from django.contrib.auth.forms import PasswordResetForm
+
     template = 'registration/registartion_form.html'
     if request.method == "POST":
         form = PasswordResetForm(request.POST)
@@ -35,30 +42,24 @@ def password_reset(request):
 class PostListView(ListView):
     model = Post
     template_name = 'blog/index.html'
+    paginate_by = QUANTITY_POST
 
     def get_queryset(self):
-        return Post.objects.select_related(
-            'category',
-            'location',
-            'author',
-        ).prefetch_related(
-            'comments'
-        ).filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=timezone.now()
-        ).annotate(
-            comment_count=Count('comments')
-        ).order_by(
-            '-pub_date'
+        return published_posts_qs()
+
+    def paginate_queryset(self, queryset, page_size):
+        page_obj = paginated_pages(
+            queryset,
+            self.request,
+            cache_key_prefix=INDEX_CACHE_PREFIX,
+            per_page=page_size
+        )
+        return (
+            page_obj.paginator,
+            page_obj,
+            page_obj.object_list,
+            page_obj.has_other_pages()
         )
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        post_list = self.get_queryset()
-        page_obj = paginated_pages(post_list, self.request)
-        context['page_obj'] = page_obj
-        return context
 
 
 class PostCreateView(LoginRequiredMixin, CreateView):
@@ -72,7 +73,10 @@ class PostCreateView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         form.instance.author = self.request.user
         new_post = super().form_valid(form)
-        send_email_to_admin(form.instance, self.request.user)
+        post_id, user_id = self.object.pk, self.request.user.pk
+        transaction.on_commit(
+            lambda: queue_email_to_admin(post_id, user_id)
+        )
         return new_post
 
     def get_success_url(self):
@@ -86,22 +90,35 @@ class PostDetailView(DetailView):
     model = Post
     template_name = 'blog/detail.html'
 
+    def get_queryset(self):
+        return Post.objects.select_related(
+            'category',
+            'location',
+            'author',
+        ).prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related(
+                    'author'
+                ).order_by('created_at')
+            )
+        )
+
     def get_context_data(self, **kwargs):
         post = self.object
-        current_time = timezone.now()
-
-        if post.author != self.request.user:
-            if not post.is_published or not post.category.is_published:
-                raise Http404("Этот пост доступен только автору публикации.")
 
-            if post.pub_date > current_time:
-                raise Http404("Этот пост доступен только автору публикации.")
+        if post.author_id != self.request.user.id and (
+            not post.is_published
+            or not post.category.is_published
+            or post.pub_date > timezone.now()
+        ):
+            raise Http404("Этот пост доступен только автору публикации.")
 
         context = super().get_context_data(**kwargs)
-        comments = self.object.comments.all()
+        comments = list(self.object.comments.all())
         context['form'] = CommentForm()
-        context['comments'] = comments.order_by('created_at')
-        context['comment_count'] = comments.count()
+        context['comments'] = comments
+        context['comment_count'] = len(comments)
         return context
 
 
@@ -112,11 +129,8 @@ def category_posts(request, category_slug):
         slug=category_slug,
         is_published=True
     )
-    post_list = Post.objects.filter(
-        category=category,
-        is_published=True,
-    ).annotate(comment_count=Count('comments'))
-    post_list = PostListView().get_queryset().filter(category=category)
+    now = timezone.now()
+    post_list = published_posts_qs(now).filter(category=category)
     page_obj = paginated_pages(post_list, request)
     context = {'page_obj': page_obj, 'category': category}
     return render(request, template, context)
@@ -124,9 +138,17 @@ def category_posts(request, category_slug):
 
 def profile(request, username):
     user = get_object_or_404(User, username=username)
-    posts = Post.objects.filter(
-        author=user).annotate(
-        comment_count=Count('comments')).order_by('-pub_date')
+    posts = Post.objects.select_related(
+        'category',
+        'location',
+        'author',
+    ).filter(
+        author=user
+    ).only(
+        *POST_CARD_FIELDS
+    ).order_by(
+        '-pub_date'
+    )
     page_obj = paginated_pages(posts, request)
     template = 'blog/profile.html'
     context = {
@@ -141,12 +163,12 @@ def edit_profile(request):
     template = 'blog/edit_profile.html'
     user = request.user
     if request.method == 'POST':
-        form = UserChangeForm(request.POST, instance=request.user)
+        form = ProfileEditForm(request.POST, instance=request.user)
         if form.is_valid():
             form.save()
             return redirect('blog:profile', username=request.user.username)
     else:
-        form = UserChangeForm(instance=request.user)
+        form = ProfileEditForm(instance=request.user)
     context = {
         'form': form,
         'user': user
@@ -156,33 +178,34 @@ def edit_profile(request):
 
 class PostUpdateView(OnlyAuthorMixin, UpdateView):
     model = Post
-    fields = ['title', 'text', 'category', 'location', 'image', 'pub_date']
+    form_class = PostEditForm
     template_name = 'blog/create.html'
 
     def get_success_url(self):
-        return reverse(
-            'blog:post_detail',
-            kwargs={'pk': self.object.pk}
-        )
+        return _post_detail_url(self.object.pk)
 
     def dispatch(self, request, *args, **kwargs):
+        post = self.get_object()
         if (
             not request.user.is_authenticated
-                or self.get_object().author != request.user
+                or post.author_id != request.user.id
         ):
-            return redirect('blog:post_detail', pk=self.get_object().pk)
+            return redirect('blog:post_detail', pk=post.pk)
         return super().dispatch(request, *args, **kwargs)
 
 
 @login_required
 def add_comment(request, post_id):
-    post = get_object_or_404(Post, pk=post_id)
     form = CommentForm(request.POST)
     if form.is_valid():
         comment = form.save(commit=False)
         comment.author = request.user
-        comment.post = post
-        comment.save()
+        comment.post_id = post_id
+        try:
+            with transaction.atomic():
+                comment.save()
+        except IntegrityError:
+            raise Http404('Публикация не найдена.')
     return redirect('blog:post_detail', pk=post_id)
 
 
@@ -192,7 +215,7 @@ class CommentUpdateView(OnlyAuthorMixin, UpdateView):
     template_name = 'blog/comment.html'
 
     def get_success_url(self):
-        return reverse('blog:post_detail', kwargs={'pk': self.object.post.pk})
+        return _post_detail_url(self.object.post_id)
 
 
 class PostDeleteView(OnlyAuthorMixin, DeleteView):
@@ -208,7 +231,7 @@ class CommentDeleteView(OnlyAuthorMixin, DeleteView):
     template_name = 'blog/comment.html'
 
     def get_success_url(self):
-        return reverse('blog:post_detail', kwargs={'pk': self.object.post.pk})
+        return _post_detail_url(self.object.post_id)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
     'SofiaTseitlin.pythonanywhere.com',
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -94,6 +95,22 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+# Without CACHE_REDIS_URL every worker process keeps its own local-memory
+# cache, so invalidating cached pages does not reach the other workers.
+
+CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -153,3 +170,17 @@ MEDIA_ROOT = BASE_DIR / 'media'
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
+
+CELERY_BROKER_URL = os.getenv(
+    'CELERY_BROKER_URL', 'redis://localhost:6379/0'
+)
+
+CELERY_BROKER_TRANSPORT_OPTIONS = {'max_retries': 0}
+
+CELERY_TASK_ROUTES = {
+    'blog.tasks.send_email_to_admin': {'queue': 'email_queue'},
+}
+
+CELERY_TASK_ALWAYS_EAGER = os.getenv(
+    'CELERY_TASK_ALWAYS_EAGER', ''
+).lower() in ('1', 'true')
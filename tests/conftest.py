@@ -32,6 +32,16 @@ def enable_debug_false():
         yield
 
 
+@pytest.fixture(autouse=True)
+def disable_cache():
+    with override_settings(CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+        }
+    }):
+        yield
+
+
 class SafeImportFromContextManager:
     def __init__(
             self,
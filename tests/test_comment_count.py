@@ -0,0 +1,84 @@
+from importlib import import_module
+
+import pytest
+from blog.models import Comment, Post
+from django.apps import apps
+
+
+@pytest.fixture
+def post(mixer, user):
+    return mixer.blend('blog.Post', author=user)
+
+
+@pytest.mark.django_db
+def test_comment_count_increments_on_create(mixer, post):
+    mixer.cycle(2).blend('blog.Comment', post=post)
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        'Убедитесь, что создание комментария увеличивает '
+        '`comment_count` публикации.'
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_not_incremented_on_comment_update(mixer, post):
+    comment = mixer.blend('blog.Comment', post=post)
+    comment.text = 'Новый текст'
+    comment.save()
+    post.refresh_from_db()
+    assert post.comment_count == 1
+
+
+@pytest.mark.django_db
+def test_comment_count_decrements_on_delete(mixer, post):
+    comments = mixer.cycle(2).blend('blog.Comment', post=post)
+    comments[0].delete()
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        'Убедитесь, что удаление комментария уменьшает '
+        '`comment_count` публикации.'
+    )
+
+
+@pytest.mark.django_db
+def test_post_cascade_runs_comment_decrement_handler(mixer, post, user):
+    other_post = mixer.blend('blog.Post', author=user)
+    mixer.blend('blog.Comment', post=other_post)
+    mixer.cycle(2).blend('blog.Comment', post=post)
+    post_pk = post.pk
+    post.delete()
+    assert not Comment.objects.filter(post_id=post_pk).exists(), (
+        'Убедитесь, что комментарии удаляются вместе с публикацией.'
+    )
+    other_post.refresh_from_db()
+    assert other_post.comment_count == 1, (
+        'Убедитесь, что каскадное удаление комментариев не меняет '
+        '`comment_count` других публикаций.'
+    )
+
+
+@pytest.mark.django_db
+def test_full_post_save_keeps_comment_count(mixer, post):
+    stale_post = Post.objects.get(pk=post.pk)
+    mixer.blend('blog.Comment', post=post)
+    stale_post.title = 'Новый заголовок'
+    stale_post.save()
+    post.refresh_from_db()
+    assert post.title == 'Новый заголовок'
+    assert post.comment_count == 1, (
+        'Убедитесь, что сохранение публикации не перезаписывает '
+        '`comment_count` устаревшим значением.'
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_backfill_migration(mixer, post, user):
+    other_post = mixer.blend('blog.Post', author=user)
+    mixer.cycle(3).blend('blog.Comment', post=post)
+    Post.objects.update(comment_count=7)
+    migration = import_module('blog.migrations.0017_post_comment_count')
+    migration.fill_comment_count(apps, None)
+    post.refresh_from_db()
+    other_post.refresh_from_db()
+    assert post.comment_count == 3
+    assert other_post.comment_count == 0
@@ -0,0 +1,119 @@
+import pytest
+from blog.utils import (INDEX_CACHE_PREFIX, invalidate_cached_pages,
+                        paginated_pages, published_posts_qs)
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture(autouse=True)
+def local_memory_cache(disable_cache):
+    with override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'test-post-cache',
+        }
+    }):
+        cache.clear()
+        yield
+        cache.clear()
+
+
+@pytest.fixture
+def published_posts(mixer, user, published_category):
+    return mixer.cycle(3).blend(
+        'blog.Post', author=user, category=published_category,
+        is_published=True
+    )
+
+
+def count_queries(ctx):
+    return [
+        query['sql'] for query in ctx.captured_queries
+        if 'COUNT(' in query['sql'].upper()
+    ]
+
+
+@pytest.mark.django_db
+def test_published_posts_count_is_cached(published_posts):
+    request = RequestFactory().get('/')
+    paginated_pages(published_posts_qs(), request)
+    with CaptureQueriesContext(connection) as ctx:
+        page_obj = paginated_pages(published_posts_qs(), request)
+    assert page_obj.paginator.count == len(published_posts)
+    assert not count_queries(ctx), (
+        'Убедитесь, что повторный запрос страницы не выполняет COUNT.'
+    )
+
+
+def get_index_page(page='1', per_page=10):
+    request = RequestFactory().get('/', {'page': page})
+    return paginated_pages(
+        published_posts_qs(), request,
+        cache_key_prefix=INDEX_CACHE_PREFIX, per_page=per_page
+    )
+
+
+@pytest.mark.django_db
+def test_index_page_cache_hit(published_posts):
+    page_obj = get_index_page()
+    with CaptureQueriesContext(connection) as ctx:
+        cached_page_obj = get_index_page()
+    assert not ctx.captured_queries, (
+        'Убедитесь, что закэшированная страница ленты отдаётся '
+        'без запросов к базе данных.'
+    )
+    assert list(cached_page_obj) == list(page_obj)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('page', ['abc', '0001', '', '999'])
+def test_index_page_cache_key_uses_page_number(published_posts, page):
+    get_index_page()
+    with CaptureQueriesContext(connection) as ctx:
+        page_obj = get_index_page(page)
+    assert page_obj.number == 1
+    assert not ctx.captured_queries, (
+        'Убедитесь, что ключ кэша строится по номеру страницы, '
+        'а не по строке из запроса.'
+    )
+
+
+@pytest.mark.django_db
+def test_index_page_cache_version_bump(published_posts):
+    get_index_page()
+    invalidate_cached_pages(INDEX_CACHE_PREFIX)
+    with CaptureQueriesContext(connection) as ctx:
+        get_index_page()
+    assert ctx.captured_queries, (
+        'Убедитесь, что после сброса версии страница ленты '
+        'строится заново.'
+    )
+
+
+@pytest.mark.django_db
+def test_index_page_cache_key_includes_page_size(published_posts):
+    assert len(get_index_page(per_page=2)) == 2
+    assert len(get_index_page(per_page=3)) == 3
+
+
+@pytest.mark.django_db
+def test_cache_version_not_bumped_before_commit(
+        mixer, user, published_posts, django_capture_on_commit_callbacks
+):
+    get_index_page()
+    with django_capture_on_commit_callbacks() as callbacks:
+        mixer.blend('blog.Comment', post=published_posts[0], author=user)
+        with CaptureQueriesContext(connection) as ctx:
+            get_index_page()
+    assert callbacks
+    assert not ctx.captured_queries, (
+        'Убедитесь, что кэш ленты сбрасывается только после '
+        'фиксации транзакции.'
+    )
+    for callback in callbacks:
+        callback()
+    with CaptureQueriesContext(connection) as ctx:
+        get_index_page()
+    assert ctx.captured_queries
@@ -0,0 +1,54 @@
+import logging
+from unittest import mock
+
+import pytest
+from blog.models import Post
+from blog.tasks import queue_email_to_admin, send_email_to_admin
+from kombu.exceptions import OperationalError
+
+
+@pytest.mark.django_db
+def test_post_creation_queues_admin_email(
+        user, user_client, published_category, published_location,
+        django_capture_on_commit_callbacks
+):
+    data = {
+        'title': 'Заголовок',
+        'text': 'Текст',
+        'pub_date': '2020-01-01',
+        'category': published_category.pk,
+        'location': published_location.pk,
+        'is_published': True,
+    }
+    with mock.patch.object(send_email_to_admin, 'apply_async') as apply:
+        with django_capture_on_commit_callbacks() as callbacks:
+            user_client.post('/posts/create/', data=data)
+        post = Post.objects.get()
+        apply.assert_not_called()
+        for callback in callbacks:
+            callback()
+    apply.assert_called_once_with((post.pk, user.pk), retry=False)
+
+
+@pytest.mark.django_db
+def test_admin_email_task_sends_email(mixer, user, mailoutbox):
+    post = mixer.blend('blog.Post', author=user)
+    send_email_to_admin(post.pk, user.pk)
+    assert len(mailoutbox) == 1
+    assert post.title in mailoutbox[0].subject
+
+
+@pytest.mark.django_db
+def test_admin_email_task_skips_missing_post(user, mailoutbox):
+    send_email_to_admin(0, user.pk)
+    assert not mailoutbox
+
+
+def test_broker_error_is_logged(caplog):
+    with mock.patch.object(
+        send_email_to_admin, 'apply_async',
+        side_effect=OperationalError('broker is down')
+    ):
+        with caplog.at_level(logging.WARNING, logger='blog.tasks'):
+            queue_email_to_admin(1, 1)
+    assert caplog.records